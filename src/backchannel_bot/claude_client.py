@@ -1,17 +1,166 @@
 """Claude Code client module for backchannel-bot."""
 
 import asyncio
+import functools
+import hashlib
 import json
 import logging
 import os
-import subprocess
+import time
+from collections import OrderedDict
 from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the installed extras
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# orjson (the optional "fast" extra) parses Claude's JSON lines several times
+# faster; its JSONDecodeError subclasses json.JSONDecodeError.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Fixed argv heads for the claude CLI. Use --dangerously-skip-permissions to
+# bypass permission prompts since we can't handle them interactively via Discord.
+_PRINT_ARGV = ("claude", "-p", "--dangerously-skip-permissions")
+_STREAM_ARGV = (
+    "claude",
+    "-p",
+    "--input-format",
+    "stream-json",
+    "--output-format",
+    "stream-json",
+    "--verbose",
+    "--dangerously-skip-permissions",
+)
+
+_NOT_INSTALLED_MESSAGE = "Claude Code is not installed"
+
+# Session flags for the modes that take no argument ("resume:<id>" carries one)
+_STATIC_MODE_ARGS: dict[str, tuple[str, ...]] = {
+    "fresh": (),
+    "continue": ("--continue",),
+}
+
+# stream-json lines can carry whole tool outputs; asyncio's default 64 KiB
+# readline limit is far too small for them.
+_STREAM_LINE_LIMIT = 16 * 1024 * 1024
+
+# How much of a persistent session's stderr is kept for error messages
+_STDERR_TAIL_BYTES = 4096
+
+# How long a session listing is reused, so `!session` followed by
+# `!session <number>` reads the directory once and numbers stay stable.
+_SESSIONS_CACHE_SECONDS = 30
+
+
+@functools.lru_cache(maxsize=32)
+def _claude_argv(head: tuple[str, ...], session_mode: str) -> tuple[str, ...]:
+    """Build the claude argv for a command head and session mode.
+
+    Memoized: the few modes in use each map to one prebuilt tuple, so spawning
+    Claude does not re-parse the mode or rebuild the argument list.
+
+    Args:
+        head: The fixed argv head (_PRINT_ARGV or _STREAM_ARGV).
+        session_mode: "fresh", "continue", or "resume:<session_id>".
+
+    Returns:
+        The full argv ("fresh" adds no session flags).
+    """
+    static_args = _STATIC_MODE_ARGS.get(session_mode)
+    if static_args is not None:
+        return (*head, *static_args)
+    kind, _, session_id = session_mode.partition(":")
+    if kind == "resume":
+        return (*head, "--resume", session_id)
+    return head
+
+
+def _print_output(returncode: int | None, stdout: bytes, stderr: bytes) -> str:
+    """Turn the outcome of a `claude -p` run into response text.
+
+    Works in bytes and decodes once: trailing whitespace is trimmed on the raw
+    bytes (a C loop) so the blank tail is never decoded, and stderr is only
+    decoded when the command actually failed.
+
+    Args:
+        returncode: Exit status of the claude process.
+        stdout: Raw standard output.
+        stderr: Raw standard error.
+
+    Returns:
+        Claude's response text.
+
+    Raises:
+        ClaudeError: If the command exited with a non-zero status.
+    """
+    if returncode == 0:
+        output = stdout.rstrip().decode("utf-8", errors="replace")
+        logger.debug("Claude print mode succeeded, output: %d chars", len(output))
+        return output
+    error_msg = stderr.decode("utf-8", errors="replace").strip() or "command failed"
+    logger.error("Claude print mode failed: %s", error_msg)
+    raise ClaudeError(f"Claude command failed: {error_msg}")
+
+
+def _user_message_line(prompt: str) -> bytes:
+    """Encode a prompt as one stream-json user message line for Claude's stdin.
+
+    Args:
+        prompt: The prompt text to send.
+
+    Returns:
+        The newline-terminated JSON message, UTF-8 encoded.
+    """
+    message = {
+        "type": "user",
+        "message": {"role": "user", "content": [{"type": "text", "text": prompt}]},
+    }
+    return json.dumps(message).encode("utf-8") + b"\n"
+
+
+def _read_first_prompt(session_file: Path) -> str | None:
+    """Extract the first user prompt from a Claude session file.
+
+    Reads raw bytes and only parses lines that mention a user entry, so the
+    summary and system records ahead of the first prompt are skipped without
+    decoding them.
+
+    Args:
+        session_file: Path to a Claude session JSONL file.
+
+    Returns:
+        The first 80 characters of the first user prompt, or None if not found.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    with open(session_file, "rb") as f:
+        for line in f:
+            if b'"user"' not in line:
+                continue
+            try:
+                entry = _json_loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue
+            # Look for user messages
+            if entry.get("type") == "user" and entry.get("message"):
+                msg = entry["message"]
+                if isinstance(msg, dict) and msg.get("content"):
+                    content = msg["content"]
+                    if isinstance(content, list) and len(content) > 0:
+                        text_block = content[0]
+                        if isinstance(text_block, dict):
+                            return text_block.get("text", "")[:80]
+                    elif isinstance(content, str):
+                        return content[:80]
+    return None
+
 
 class ClaudeError(Exception):
     """Exception raised for Claude Code-related errors."""
@@ -19,7 +168,7 @@ class ClaudeError(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PermissionRequest:
     """Represents a permission request from Claude Code."""
 
@@ -28,7 +177,7 @@ class PermissionRequest:
     tool_input: dict
 
 
-@dataclass
+@dataclass(slots=True)
 class ClaudeStreamMessage:
     """A message from the Claude stream."""
 
@@ -85,41 +234,36 @@ class ClaudeStreamSession:
         Raises:
             ClaudeError: If Claude Code is not installed or command fails.
         """
-        cmd = [
-            "claude",
-            "-p",
-            prompt,
-            "--input-format",
-            "stream-json",
-            "--output-format",
-            "stream-json",
-            "--verbose",
-            "--dangerously-skip-permissions",
-        ]
-
-        if session_mode == "continue":
-            cmd.append("--continue")
-        elif session_mode.startswith("resume:"):
-            session_id = session_mode[7:]
-            cmd.extend(["--resume", session_id])
-
-        logger.debug("Starting Claude stream session: %s", " ".join(cmd))
+        cmd = _claude_argv(_STREAM_ARGV, session_mode)
+
+        # %-style args are only formatted when DEBUG is on, but the join below
+        # is evaluated eagerly, so guard it explicitly.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Starting Claude stream session: %s", " ".join(cmd))
 
         try:
+            # stderr is never read here; a pipe would only cost an extra fd and
+            # could stall Claude once its buffer filled up.
             self._process = await asyncio.create_subprocess_exec(
                 *cmd,
                 stdin=asyncio.subprocess.PIPE,
                 stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
                 cwd=self._cwd,
+                limit=_STREAM_LINE_LIMIT,
             )
         except FileNotFoundError as e:
-            raise ClaudeError("Claude Code is not installed") from e
+            raise ClaudeError(_NOT_INSTALLED_MESSAGE) from e
 
         assert self._process.stdout is not None
         assert self._process.stdin is not None
 
         try:
+            # The prompt goes over stdin as a stream-json user message rather
+            # than argv, so size and content are never limited by the command line.
+            self._process.stdin.write(_user_message_line(prompt))
+            await self._process.stdin.drain()
+
             async for message in self._read_stream():
                 yield message
                 if message.is_complete:
@@ -148,7 +292,7 @@ class ClaudeStreamSession:
                 break
 
             try:
-                data = json.loads(line.decode("utf-8").strip())
+                data = _json_loads(line)
             except json.JSONDecodeError:
                 logger.debug("Skipping non-JSON line: %s", line[:100])
                 continue
@@ -239,19 +383,261 @@ class ClaudeStreamSession:
         )
 
 
+class ClaudeSession:
+    """A long-lived Claude CLI process that answers many prompts.
+
+    Spawning `claude -p` costs seconds of startup per message. This keeps one
+    process running in stream-json mode and feeds it one user message per
+    prompt; each turn ends with a `result` event on stdout. Turns belong to
+    one conversation, so callers must not overlap ask() calls (ClaudeClient
+    holds its session lock across each one).
+    """
+
+    def __init__(self, session_mode: str, cwd: str | None = None) -> None:
+        """Initialize a persistent session (the process starts lazily).
+
+        Args:
+            session_mode: Session mode the process is started with.
+            cwd: Working directory for the Claude process.
+        """
+        self.session_mode = session_mode
+        self.last_used = time.monotonic()
+        self._cwd = cwd or os.getcwd()
+        self._process: asyncio.subprocess.Process | None = None
+        self._stderr_task: asyncio.Task[None] | None = None
+        self._stderr_tail = bytearray()
+
+    def is_alive(self) -> bool:
+        """Return True if the Claude process is running."""
+        return self._process is not None and self._process.returncode is None
+
+    def idle_seconds(self) -> float:
+        """Return the number of seconds since the last prompt finished."""
+        return time.monotonic() - self.last_used
+
+    async def _spawn(self) -> asyncio.subprocess.Process:
+        """Start the Claude process for this session.
+
+        Returns:
+            The running process.
+
+        Raises:
+            ClaudeError: If Claude Code is not installed.
+        """
+        cmd = _claude_argv(_STREAM_ARGV, self.session_mode)
+
+        logger.info("Starting persistent Claude session (session_mode=%s)", self.session_mode)
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=self._cwd,
+                limit=_STREAM_LINE_LIMIT,
+            )
+        except FileNotFoundError as e:
+            raise ClaudeError(_NOT_INSTALLED_MESSAGE) from e
+
+        # Drain stderr for the life of the process so it cannot fill its pipe
+        # and stall Claude; the tail explains why a session died.
+        self._stderr_tail.clear()
+        self._stderr_task = asyncio.ensure_future(self._drain_stderr(process))
+        return process
+
+    async def _drain_stderr(self, process: asyncio.subprocess.Process) -> None:
+        """Read the process's stderr until EOF, keeping only its tail.
+
+        Args:
+            process: The running Claude process.
+        """
+        assert process.stderr is not None
+
+        while chunk := await process.stderr.read(_STDERR_TAIL_BYTES):
+            self._stderr_tail += chunk
+            del self._stderr_tail[:-_STDERR_TAIL_BYTES]
+
+    def _exit_error(self) -> ClaudeError:
+        """Build the error for a session whose process went away mid-turn.
+
+        Returns:
+            A ClaudeError carrying the tail of Claude's stderr, if any.
+        """
+        error_msg = self._stderr_tail.decode("utf-8", errors="replace").strip()
+        if not error_msg:
+            return ClaudeError("Claude session exited unexpectedly")
+        logger.error("Claude session exited: %s", error_msg)
+        return ClaudeError(f"Claude session exited unexpectedly: {error_msg}")
+
+    async def ask(self, prompt: str, timeout: int = 300) -> str:
+        """Send a prompt to the session and wait for its result.
+
+        Args:
+            prompt: The prompt to send to Claude Code.
+            timeout: Maximum seconds to wait for the result.
+
+        Returns:
+            Claude's response text.
+
+        Raises:
+            ClaudeError: If the process dies, times out, or reports an error.
+        """
+        if not self.is_alive():
+            self._process = await self._spawn()
+        process = self._process
+        assert process is not None
+        assert process.stdin is not None
+
+        try:
+            process.stdin.write(_user_message_line(prompt))
+            await process.stdin.drain()
+            event = await asyncio.wait_for(self._read_result(process), timeout)
+        except (BrokenPipeError, ConnectionResetError) as e:
+            await self.close()
+            raise self._exit_error() from e
+        except asyncio.TimeoutError as e:
+            await self.close()
+            raise ClaudeError(f"Claude command timed out after {timeout} seconds") from e
+        except BaseException:
+            # The turn is unfinished (e.g. cancelled, or a line over the
+            # readline limit); its result would answer the next prompt.
+            await self.close()
+            raise
+        finally:
+            self.last_used = time.monotonic()
+
+        if event is None:
+            await self.close()
+            raise self._exit_error()
+        if event.get("is_error"):
+            error_msg = event.get("result") or event.get("subtype") or "command failed"
+            raise ClaudeError(f"Claude command failed: {error_msg}")
+        return str(event.get("result", "")).rstrip()
+
+    async def _read_result(self, process: asyncio.subprocess.Process) -> dict | None:
+        """Read stream-json events until the current turn's result arrives.
+
+        Args:
+            process: The running Claude process.
+
+        Returns:
+            The turn's `result` event, or None if the process exited first.
+        """
+        assert process.stdout is not None
+
+        while True:
+            line = await process.stdout.readline()
+            if not line:
+                return None
+
+            try:
+                data = _json_loads(line)
+            except json.JSONDecodeError:
+                logger.debug("Skipping non-JSON line: %s", line[:100])
+                continue
+
+            if data.get("type") == "result":
+                return data
+
+    async def close(self) -> None:
+        """Terminate the Claude process if it is running."""
+        process = self._process
+        self._process = None
+        if process is not None and process.returncode is None:
+            process.terminate()
+            await process.wait()
+
+        stderr_task = self._stderr_task
+        self._stderr_task = None
+        if stderr_task is not None:
+            # stderr hits EOF once the process is gone; don't wait on a
+            # grandchild that kept the pipe open.
+            await asyncio.wait({stderr_task}, timeout=1)
+            stderr_task.cancel()
+
+
 class ClaudeClient:
     """Client for interacting with Claude Code CLI."""
 
-    def __init__(self) -> None:
-        """Initialize the Claude Code client."""
-        pass
+    def __init__(
+        self,
+        session_timeout: float = 0,
+        cache_ttl: float = 0,
+        cache_size: int = 500,
+    ) -> None:
+        """Initialize the Claude Code client.
+
+        Args:
+            session_timeout: Idle seconds after which the persistent Claude
+                session is restarted. 0 disables the persistent session and
+                spawns `claude -p` for every prompt.
+            cache_ttl: Seconds a response stays in the in-memory response cache.
+                0 (the default) disables caching: prompts drive an agent that
+                edits files and runs commands, so a cache hit skips that work.
+            cache_size: Maximum number of cached responses (oldest evicted first).
+        """
+        self._session_timeout = session_timeout
+        self._session: ClaudeSession | None = None
+        self._session_lock = asyncio.Lock()
+        self._cache_ttl = cache_ttl
+        self._cache_size = cache_size
+        self._cache: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._sessions_cache: tuple[tuple[str, int], float, list[dict]] | None = None
+
+    def _cache_key(self, prompt: str, session_mode: str) -> str | None:
+        """Build the response-cache key for a prompt.
+
+        Whitespace is collapsed so trivial retyping still hits. Case is kept:
+        identifiers and paths are case-sensitive. "fresh" prompts are never
+        cached.
+
+        Args:
+            prompt: The prompt to send to Claude Code.
+            session_mode: How to handle session continuation.
 
-    def run_claude_print(
-        self, prompt: str, timeout: int = 300, session_mode: str = "continue"
+        Returns:
+            The cache key, or None if the prompt should not be cached.
+        """
+        if self._cache_ttl <= 0 or session_mode == "fresh":
+            return None
+        normalized = " ".join(prompt.split())
+        return hashlib.sha256(f"{session_mode}:{normalized}".encode()).hexdigest()
+
+    def _cache_get(self, key: str) -> str | None:
+        """Return a cached response if present and not expired."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        response, stored_at = entry
+        if time.monotonic() - stored_at > self._cache_ttl:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        logger.debug("Returning cached Claude response (%d chars)", len(response))
+        return response
+
+    def _cache_put(self, key: str, response: str) -> None:
+        """Store a response, evicting the least recently used entries."""
+        self._cache[key] = (response, time.monotonic())
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+    async def run_claude_print_async(
+        self,
+        prompt: str,
+        timeout: int = 300,
+        session_mode: str = "continue",
+        cache_response: bool = True,
     ) -> str:
-        """Run Claude Code in print mode and return the response.
+        """Run a prompt through Claude Code without blocking the event loop.
 
-        Executes `claude -p "prompt"` to get a reliable text response.
+        Prompts for "continue" and "resume:<id>" modes are sent to a persistent
+        Claude process (see ClaudeSession) when a session timeout is configured,
+        which avoids paying CLI startup on every message. The process is
+        restarted when it has died, has been idle longer than the timeout, or
+        the session mode changed. "fresh" mode always spawns a new process,
+        since every prompt must start a new conversation.
 
         Args:
             prompt: The prompt to send to Claude Code.
@@ -260,6 +646,7 @@ class ClaudeClient:
                 - "fresh": Start a new session each time
                 - "continue": Continue the most recent session (--continue)
                 - "resume:<session_id>": Resume a specific session (--resume <id>)
+            cache_response: Use the response cache if it is enabled (default: True).
 
         Returns:
             Claude's response text.
@@ -267,50 +654,114 @@ class ClaudeClient:
         Raises:
             ClaudeError: If Claude Code is not installed or command fails.
         """
-        logger.debug(
-            "Running Claude Code in print mode (session_mode=%s): %r",
-            session_mode,
-            prompt[:100],
-        )
+        key = self._cache_key(prompt, session_mode) if cache_response else None
+        if key is not None:
+            cached = self._cache_get(key)
+            if cached is not None:
+                return cached
+
+        response = await self._run_claude_print_uncached(prompt, timeout, session_mode)
+        if key is not None:
+            self._cache_put(key, response)
+        return response
+
+    async def _run_claude_print_uncached(self, prompt: str, timeout: int, session_mode: str) -> str:
+        """Dispatch a prompt to the persistent session or a one-shot process.
+
+        Args:
+            prompt: The prompt to send to Claude Code.
+            timeout: Maximum seconds to wait for response.
+            session_mode: How to handle session continuation.
+
+        Returns:
+            Claude's response text.
+
+        Raises:
+            ClaudeError: If Claude Code is not installed or command fails.
+        """
+        # Any run can create or touch a session file
+        self._sessions_cache = None
+        if self._session_timeout <= 0 or session_mode == "fresh":
+            return await self._run_claude_print_subprocess(prompt, timeout, session_mode)
+
+        async with self._session_lock:
+            session = self._session
+            if (
+                session is None
+                or session.session_mode != session_mode
+                or not session.is_alive()
+                or session.idle_seconds() > self._session_timeout
+            ):
+                if session is not None:
+                    await session.close()
+                session = self._session = ClaudeSession(session_mode)
+
+            # ask() closes the process itself whenever a turn cannot finish;
+            # a dead session is replaced on the next prompt.
+            return await session.ask(prompt, timeout=timeout)
+
+    async def _run_claude_print_subprocess(
+        self, prompt: str, timeout: int, session_mode: str
+    ) -> str:
+        """Run a one-shot `claude -p` as an asyncio subprocess.
+
+        The event loop keeps serving Discord while Claude runs, without tying
+        up an executor thread. The prompt is piped on stdin rather than passed
+        in argv, so arbitrarily long or oddly-quoted prompts are delivered
+        verbatim and never hit ARG_MAX.
+
+        Args:
+            prompt: The prompt to send to Claude Code.
+            timeout: Maximum seconds to wait for response.
+            session_mode: How to handle session continuation.
+
+        Returns:
+            Claude's response text.
+
+        Raises:
+            ClaudeError: If Claude Code is not installed or command fails.
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Running Claude Code in print mode (session_mode=%s): %r",
+                session_mode,
+                prompt[:100],
+            )
         try:
-            # Build command based on session mode
-            # Use --dangerously-skip-permissions to bypass permission prompts
-            # since we can't handle them interactively via Discord
-            cmd = ["claude", "-p", prompt, "--dangerously-skip-permissions"]
-            if session_mode == "continue":
-                cmd.append("--continue")
-            elif session_mode.startswith("resume:"):
-                session_id = session_mode[7:]
-                cmd.extend(["--resume", session_id])
-            # "fresh" mode uses no additional flags
-
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
+            process = await asyncio.create_subprocess_exec(
+                *_claude_argv(_PRINT_ARGV, session_mode),
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
             )
-            if result.returncode == 0:
-                output = result.stdout.rstrip()
-                logger.debug("Claude print mode succeeded, output: %d chars", len(output))
-                return output
-            else:
-                error_msg = result.stderr.strip() or "command failed"
-                logger.error("Claude print mode failed: %s", error_msg)
-                raise ClaudeError(f"Claude command failed: {error_msg}")
         except FileNotFoundError as e:
-            logger.exception("claude command not found")
-            raise ClaudeError("Claude Code is not installed") from e
-        except subprocess.TimeoutExpired as e:
+            logger.error("claude command not found")
+            raise ClaudeError(_NOT_INSTALLED_MESSAGE) from e
+
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                process.communicate(prompt.encode("utf-8")), timeout
+            )
+        except asyncio.TimeoutError as e:
+            process.kill()
+            await process.wait()
             logger.exception("Claude command timed out after %d seconds", timeout)
             raise ClaudeError(f"Claude command timed out after {timeout} seconds") from e
-        except subprocess.SubprocessError as e:
-            logger.exception("Subprocess error while running Claude")
-            raise ClaudeError(f"Failed to execute claude command: {e}") from e
+
+        return _print_output(process.returncode, stdout, stderr)
+
+    async def close(self) -> None:
+        """Shut down the persistent Claude session, if any."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
 
     def list_claude_sessions(self, cwd: str | None = None, limit: int = 5) -> list[dict]:
         """List Claude Code sessions for the current or specified working directory.
 
+        Results are reused for a few seconds (until the next Claude run at the
+        latest), so a listing and a following numeric selection agree.
+
         Args:
             cwd: Working directory to list sessions for (default: current directory).
             limit: Maximum number of sessions to return (default: 5).
@@ -322,6 +773,25 @@ class ClaudeClient:
         if cwd is None:
             cwd = os.getcwd()
 
+        if self._sessions_cache is not None:
+            cache_key, listed_at, cached_sessions = self._sessions_cache
+            if cache_key == (cwd, limit) and time.monotonic() - listed_at < _SESSIONS_CACHE_SECONDS:
+                return list(cached_sessions)
+
+        sessions = self._scan_claude_sessions(cwd, limit)
+        self._sessions_cache = ((cwd, limit), time.monotonic(), sessions)
+        return list(sessions)
+
+    def _scan_claude_sessions(self, cwd: str, limit: int) -> list[dict]:
+        """Read the newest Claude session files for a working directory.
+
+        Args:
+            cwd: Working directory to list sessions for.
+            limit: Maximum number of sessions to return.
+
+        Returns:
+            List of session dictionaries, most recent first.
+        """
         # Claude stores sessions in ~/.claude/projects/<escaped-path>/
         claude_projects_dir = Path.home() / ".claude" / "projects"
         escaped_path = cwd.replace("/", "-")
@@ -331,51 +801,40 @@ class ClaudeClient:
             logger.debug("No Claude sessions directory found at %s", project_sessions_dir)
             return []
 
-        sessions = []
+        # Stat every candidate first and only parse files until `limit`
+        # sessions are read; reading the first prompt is the expensive part
+        # and most files are never shown.
+        candidates = []
         for session_file in project_sessions_dir.glob("*.jsonl"):
-            session_id = session_file.stem
             # Skip if not a valid UUID pattern
-            if len(session_id) != 36:
+            if len(session_file.stem) != 36:
                 continue
-
             try:
-                # Get file modification time as timestamp
                 mtime = session_file.stat().st_mtime
-                timestamp = datetime.fromtimestamp(mtime)
-
-                # Try to extract first user prompt from the session
-                first_prompt = None
-                with open(session_file, encoding="utf-8") as f:
-                    for line in f:
-                        try:
-                            entry = json.loads(line)
-                            # Look for user messages
-                            if entry.get("type") == "user" and entry.get("message"):
-                                msg = entry["message"]
-                                if isinstance(msg, dict) and msg.get("content"):
-                                    content = msg["content"]
-                                    if isinstance(content, list) and len(content) > 0:
-                                        text_block = content[0]
-                                        if isinstance(text_block, dict):
-                                            first_prompt = text_block.get("text", "")[:80]
-                                            break
-                                    elif isinstance(content, str):
-                                        first_prompt = content[:80]
-                                        break
-                        except json.JSONDecodeError:
-                            continue
-
-                sessions.append(
-                    {
-                        "id": session_id,
-                        "timestamp": timestamp,
-                        "first_prompt": first_prompt or "(no prompt found)",
-                    }
-                )
-            except (OSError, PermissionError) as e:
+            except OSError as e:
+                logger.debug("Could not stat session file %s: %s", session_file, e)
+                continue
+            candidates.append((mtime, session_file))
+
+        # Sort by modification time (most recent first) and limit
+        candidates.sort(key=lambda c: c[0], reverse=True)
+
+        sessions = []
+        for mtime, session_file in candidates:
+            if len(sessions) == limit:
+                break
+            try:
+                first_prompt = _read_first_prompt(session_file)
+            except OSError as e:
                 logger.debug("Could not read session file %s: %s", session_file, e)
                 continue
 
-        # Sort by timestamp (most recent first) and limit
-        sessions.sort(key=lambda s: s["timestamp"], reverse=True)
-        return sessions[:limit]
+            sessions.append(
+                {
+                    "id": session_file.stem,
+                    "timestamp": datetime.fromtimestamp(mtime),
+                    "first_prompt": first_prompt or "(no prompt found)",
+                }
+            )
+
+        return sessions
@@ -1,7 +1,8 @@
 """Configuration module for backchannel-bot."""
 
 import os
-from dataclasses import dataclass, field
+from collections.abc import Mapping
+from dataclasses import dataclass
 
 
 class ConfigurationError(Exception):
@@ -9,7 +10,7 @@ class ConfigurationError(Exception):
 
 
 def _validate_discord_id(env_var: str, value: str | None) -> str | None:
-    """Validate that a Discord ID is numeric.
+    """Validate that a Discord ID is made of ASCII digits.
 
     Args:
         env_var: Name of the environment variable (for error messages)
@@ -23,7 +24,8 @@ def _validate_discord_id(env_var: str, value: str | None) -> str | None:
     """
     if value is None:
         return None
-    if not value.isdigit():
+    # isdigit() alone also accepts non-ASCII digits such as "١٢٣".
+    if not (value.isascii() and value.isdigit()):
         raise ConfigurationError(
             f"{env_var} must be a numeric Discord ID, not '{value}'. "
             f"To get a Discord ID: Enable Developer Mode in Discord settings, "
@@ -59,10 +61,38 @@ def _validate_session_mode(value: str) -> str:
     )
 
 
-@dataclass
+def _validate_seconds(env_var: str, value: str) -> float:
+    """Validate a duration in seconds.
+
+    Args:
+        env_var: Name of the environment variable (for error messages)
+        value: The value to validate
+
+    Returns:
+        The duration as a float.
+
+    Raises:
+        ConfigurationError: If the value is not a non-negative number.
+    """
+    try:
+        seconds = float(value)
+    except ValueError:
+        seconds = -1.0
+    # Written as "not >=" so NaN is rejected too
+    if not seconds >= 0:
+        raise ConfigurationError(
+            f"{env_var} must be a non-negative number of seconds, not '{value}'"
+        )
+    return seconds
+
+
+# Not frozen: `!session` switches claude_session_mode at runtime.
+@dataclass(slots=True)
 class Config:
     """Bot configuration loaded from environment variables.
 
+    Build it with Config.from_env(), which reads and validates:
+
     Required:
         DISCORD_BOT_TOKEN: Discord bot authentication token
 
@@ -73,29 +103,56 @@ class Config:
             - "fresh": Start a new session each time (`claude -p`)
             - "continue": Continue the most recent session (`claude -p --continue`)
             - "resume:<session_id>": Resume a specific session (`claude -p --resume <id>`)
+        CLAUDE_SESSION_TIMEOUT: Idle seconds before the persistent Claude process
+            is restarted (default: 0, disabled: a new process for every message).
+        CLAUDE_RESPONSE_CACHE_TTL: Seconds to reuse Claude's reply to an identical
+            prompt (default: 0, disabled).
     """
 
-    discord_bot_token: str = field(default_factory=lambda: _get_required("DISCORD_BOT_TOKEN"))
-    discord_channel_id: str | None = field(
-        default_factory=lambda: _validate_discord_id(
-            "DISCORD_CHANNEL_ID", os.environ.get("DISCORD_CHANNEL_ID")
+    discord_bot_token: str
+    discord_channel_id: str | None = None
+    discord_allowed_user_id: str | None = None
+    claude_session_mode: str = "continue"
+    claude_session_timeout: float = 0.0
+    claude_response_cache_ttl: float = 0.0
+
+    @classmethod
+    def from_env(cls, env: Mapping[str, str] | None = None) -> "Config":
+        """Load and validate configuration from environment variables.
+
+        Args:
+            env: Environment to read (default: os.environ). Bound once, so
+                every variable comes from the same mapping.
+
+        Returns:
+            The validated configuration.
+
+        Raises:
+            ConfigurationError: If a required variable is missing or a value is invalid.
+        """
+        if env is None:
+            env = os.environ
+        return cls(
+            discord_bot_token=_get_required(env, "DISCORD_BOT_TOKEN"),
+            discord_channel_id=_validate_discord_id(
+                "DISCORD_CHANNEL_ID", env.get("DISCORD_CHANNEL_ID")
+            ),
+            discord_allowed_user_id=_validate_discord_id(
+                "DISCORD_ALLOWED_USER_ID", env.get("DISCORD_ALLOWED_USER_ID")
+            ),
+            claude_session_mode=_validate_session_mode(env.get("CLAUDE_SESSION_MODE", "continue")),
+            claude_session_timeout=_validate_seconds(
+                "CLAUDE_SESSION_TIMEOUT", env.get("CLAUDE_SESSION_TIMEOUT", "0")
+            ),
+            claude_response_cache_ttl=_validate_seconds(
+                "CLAUDE_RESPONSE_CACHE_TTL", env.get("CLAUDE_RESPONSE_CACHE_TTL", "0")
+            ),
         )
-    )
-    discord_allowed_user_id: str | None = field(
-        default_factory=lambda: _validate_discord_id(
-            "DISCORD_ALLOWED_USER_ID", os.environ.get("DISCORD_ALLOWED_USER_ID")
-        )
-    )
-    claude_session_mode: str = field(
-        default_factory=lambda: _validate_session_mode(
-            os.environ.get("CLAUDE_SESSION_MODE", "continue")
-        )
-    )
 
 
-def _get_required(env_var: str) -> str:
+def _get_required(env: Mapping[str, str], env_var: str) -> str:
     """Get a required environment variable or raise ConfigurationError."""
-    value = os.environ.get(env_var)
+    value = env.get(env_var)
     if value is None:
         raise ConfigurationError(f"Required environment variable {env_var} is not set")
     return value
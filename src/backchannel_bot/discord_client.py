@@ -3,6 +3,7 @@
 import asyncio
 import contextlib
 import logging
+import re
 
 import discord
 
@@ -23,12 +24,18 @@ MAX_CHUNK_SIZE = 1900
 PERMISSION_ALLOW_EMOJI = "✅"
 PERMISSION_DENY_EMOJI = "❌"
 PERMISSION_TIMEOUT_SECONDS = 60
+_REACTION_EMOJIS = (PERMISSION_ALLOW_EMOJI, PERMISSION_DENY_EMOJI)
+
+# Whitespace skipped at the start of each chunk (same set as str.lstrip)
+_LEADING_WHITESPACE = re.compile(r"\s*")
 
 
 def chunk_message(text: str, max_size: int = MAX_CHUNK_SIZE) -> list[str]:
     """Split a message into chunks that fit within Discord's message limit.
 
-    Splits at newline boundaries when possible to preserve formatting.
+    Splits at newline boundaries when possible to preserve formatting. Walks
+    the text once with a cursor, searching each window in place, so long
+    responses are not re-sliced for every chunk.
 
     Args:
         text: The text to split into chunks.
@@ -44,34 +51,96 @@ def chunk_message(text: str, max_size: int = MAX_CHUNK_SIZE) -> list[str]:
         return [text]
 
     chunks: list[str] = []
-    remaining = text
-
-    while remaining:
-        if len(remaining) <= max_size:
-            chunks.append(remaining)
-            break
-
-        # Find a good split point within the max_size limit
-        chunk = remaining[:max_size]
-        split_pos = max_size
-
-        # Prefer splitting at newline boundaries
-        last_newline = chunk.rfind("\n")
-        if last_newline > 0:
-            # Split at the newline (keep newline with current chunk)
-            split_pos = last_newline + 1
-        else:
-            # No newline found, try splitting at last space
-            last_space = chunk.rfind(" ")
-            if last_space > 0:
-                split_pos = last_space + 1
+    start = 0
+    end = len(text)
+
+    while end - start > max_size:
+        limit = start + max_size
+
+        # Prefer splitting at newline boundaries (keep newline with current
+        # chunk), then at the last space, else hard-split at the limit
+        split_pos = text.rfind("\n", start + 1, limit)
+        if split_pos == -1:
+            split_pos = text.rfind(" ", start + 1, limit)
+        split_pos = limit if split_pos == -1 else split_pos + 1
+
+        chunks.append(text[start:split_pos].rstrip())
+        start = _LEADING_WHITESPACE.match(text, split_pos).end()
 
-        chunks.append(remaining[:split_pos].rstrip())
-        remaining = remaining[split_pos:].lstrip()
+    if start < end:
+        chunks.append(text[start:])
 
     return chunks
 
 
+def _bash_fields(tool_name: str, tool_input: dict) -> dict[str, object]:
+    """Template fields for a Bash permission request."""
+    description = tool_input.get("description", "")
+    return {
+        "command": tool_input.get("command", ""),
+        "description": f"*{description}*" if description else "",
+    }
+
+
+def _write_fields(tool_name: str, tool_input: dict) -> dict[str, object]:
+    """Template fields for a Write permission request."""
+    content = tool_input.get("content", "")
+    return {
+        "file_path": tool_input.get("file_path", ""),
+        "preview": content[:200] + "..." if len(content) > 200 else content,
+    }
+
+
+def _edit_fields(tool_name: str, tool_input: dict) -> dict[str, object]:
+    """Template fields for an Edit permission request."""
+    return {
+        "file_path": tool_input.get("file_path", ""),
+        "old_string": tool_input.get("old_string", "")[:100],
+        "new_string": tool_input.get("new_string", "")[:100],
+    }
+
+
+def _generic_fields(tool_name: str, tool_input: dict) -> dict[str, object]:
+    """Template fields for any other tool's permission request."""
+    return {"tool_name": tool_name, "input_preview": str(tool_input)[:300]}
+
+
+# Permission request message templates, assembled once at import. Only the
+# templates are parsed by str.format, so braces in tool input are safe.
+_PERMISSION_HEADER = "**🔐 Permission Request**\n\n"
+_PERMISSION_FOOTER = (
+    f"React with {PERMISSION_ALLOW_EMOJI} to allow or {PERMISSION_DENY_EMOJI} to deny."
+)
+_PERMISSION_FORMATS = {
+    "Bash": (
+        _PERMISSION_HEADER
+        + "Claude wants to run a **Bash command**:\n```\n{command}\n```\n{description}\n\n"
+        + _PERMISSION_FOOTER,
+        _bash_fields,
+    ),
+    "Write": (
+        _PERMISSION_HEADER
+        + "Claude wants to **write to file**: `{file_path}`\n```\n{preview}\n```\n\n"
+        + _PERMISSION_FOOTER,
+        _write_fields,
+    ),
+    "Edit": (
+        _PERMISSION_HEADER
+        + "Claude wants to **edit file**: `{file_path}`\n"
+        + "Replace:\n```\n{old_string}...\n```\n"
+        + "With:\n```\n{new_string}...\n```\n\n"
+        + _PERMISSION_FOOTER,
+        _edit_fields,
+    ),
+}
+_GENERIC_PERMISSION_FORMAT = (
+    _PERMISSION_HEADER
+    + "Claude wants to use **{tool_name}**:\n```\n{input_preview}\n```\n\n"
+    + _PERMISSION_FOOTER,
+    _generic_fields,
+)
+
+
 class BackchannelBot(discord.Client):
     """Discord client for backchannel communication with Claude Code."""
 
@@ -87,11 +156,19 @@ class BackchannelBot(discord.Client):
         super().__init__(intents=intents)
         self.config = config
         self.claude_client = claude_client
+        # Open permission prompts by message ID: (responding user ID, future
+        # resolved with True for allow / False for deny)
+        self._pending_permissions: dict[int, tuple[int, asyncio.Future[bool]]] = {}
 
     async def on_ready(self) -> None:
         """Handle successful connection to Discord."""
         logger.info("Logged in as %s", self.user)
 
+    async def close(self) -> None:
+        """Shut down the persistent Claude session, then the Discord client."""
+        await self.claude_client.close()
+        await super().close()
+
     async def on_disconnect(self) -> None:
         """Handle disconnection from Discord."""
         logger.warning("Disconnected from Discord")
@@ -108,6 +185,24 @@ class BackchannelBot(discord.Client):
         """
         logger.exception("Error in event handler '%s'", event)
 
+    async def on_raw_reaction_add(self, payload: discord.RawReactionActionEvent) -> None:
+        """Resolve the permission prompt a reaction answers, if any.
+
+        One listener serves every open prompt: the reaction's message ID is
+        looked up in the pending-permission registry instead of being checked
+        against one wait_for predicate per prompt.
+
+        Args:
+            payload: The raw reaction event from Discord.
+        """
+        pending = self._pending_permissions.get(payload.message_id)
+        if pending is None:
+            return
+        author_id, future = pending
+        emoji = str(payload.emoji)
+        if payload.user_id == author_id and emoji in _REACTION_EMOJIS and not future.done():
+            future.set_result(emoji == PERMISSION_ALLOW_EMOJI)
+
     async def on_message(self, message: discord.Message) -> None:
         """Handle incoming messages.
 
@@ -297,12 +392,8 @@ class BackchannelBot(discord.Client):
         Returns:
             Claude's response text.
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            lambda: self.claude_client.run_claude_print(
-                prompt, session_mode=self.config.claude_session_mode
-            ),
+        return await self.claude_client.run_claude_print_async(
+            prompt, session_mode=self.config.claude_session_mode
         )
 
     async def send_response(
@@ -348,50 +439,8 @@ class BackchannelBot(discord.Client):
         Returns:
             A formatted string describing the permission request.
         """
-        tool_name = perm_req.tool_name
-        tool_input = perm_req.tool_input
-
-        # Format based on common tool types
-        if tool_name == "Bash":
-            command = tool_input.get("command", "")
-            description = tool_input.get("description", "")
-            return (
-                f"**🔐 Permission Request**\n\n"
-                f"Claude wants to run a **Bash command**:\n"
-                f"```\n{command}\n```\n"
-                f"{f'*{description}*' if description else ''}\n\n"
-                f"React with {PERMISSION_ALLOW_EMOJI} to allow or {PERMISSION_DENY_EMOJI} to deny."
-            )
-        elif tool_name == "Write":
-            file_path = tool_input.get("file_path", "")
-            content = tool_input.get("content", "")
-            preview = content[:200] + "..." if len(content) > 200 else content
-            return (
-                f"**🔐 Permission Request**\n\n"
-                f"Claude wants to **write to file**: `{file_path}`\n"
-                f"```\n{preview}\n```\n\n"
-                f"React with {PERMISSION_ALLOW_EMOJI} to allow or {PERMISSION_DENY_EMOJI} to deny."
-            )
-        elif tool_name == "Edit":
-            file_path = tool_input.get("file_path", "")
-            old_string = tool_input.get("old_string", "")[:100]
-            new_string = tool_input.get("new_string", "")[:100]
-            return (
-                f"**🔐 Permission Request**\n\n"
-                f"Claude wants to **edit file**: `{file_path}`\n"
-                f"Replace:\n```\n{old_string}...\n```\n"
-                f"With:\n```\n{new_string}...\n```\n\n"
-                f"React with {PERMISSION_ALLOW_EMOJI} to allow or {PERMISSION_DENY_EMOJI} to deny."
-            )
-        else:
-            # Generic format for other tools
-            input_preview = str(tool_input)[:300]
-            return (
-                f"**🔐 Permission Request**\n\n"
-                f"Claude wants to use **{tool_name}**:\n"
-                f"```\n{input_preview}\n```\n\n"
-                f"React with {PERMISSION_ALLOW_EMOJI} to allow or {PERMISSION_DENY_EMOJI} to deny."
-            )
+        template, fields = _PERMISSION_FORMATS.get(perm_req.tool_name, _GENERIC_PERMISSION_FORMAT)
+        return template.format_map(fields(perm_req.tool_name, perm_req.tool_input))
 
     async def _request_permission(
         self,
@@ -402,7 +451,8 @@ class BackchannelBot(discord.Client):
         """Display a permission request in Discord and wait for user response.
 
         Sends a message with the permission details and adds reaction buttons.
-        Waits for the user to react with allow or deny.
+        Waits for the user to react with allow or deny; the reaction is
+        delivered by on_raw_reaction_add through the pending-permission registry.
 
         Args:
             channel: The Discord channel to send the request to.
@@ -423,42 +473,37 @@ class BackchannelBot(discord.Client):
         # Get the last message (the one with the reaction buttons)
         perm_message = messages[-1]
 
-        # Add reaction buttons
-        try:
-            await perm_message.add_reaction(PERMISSION_ALLOW_EMOJI)
-            await perm_message.add_reaction(PERMISSION_DENY_EMOJI)
-        except discord.DiscordException as e:
-            logger.error("Failed to add reaction buttons: %s", e)
-            return False
-
-        # Wait for user reaction
-        def check(reaction: discord.Reaction, user: discord.User) -> bool:
-            return (
-                user.id == author_id
-                and reaction.message.id == perm_message.id
-                and str(reaction.emoji) in (PERMISSION_ALLOW_EMOJI, PERMISSION_DENY_EMOJI)
-            )
-
+        # Register before adding the buttons so an early reaction is not missed
+        future: asyncio.Future[bool] = asyncio.get_running_loop().create_future()
+        self._pending_permissions[perm_message.id] = (author_id, future)
         try:
-            reaction, user = await self.wait_for(
-                "reaction_add",
-                timeout=PERMISSION_TIMEOUT_SECONDS,
-                check=check,
-            )
-            allowed = str(reaction.emoji) == PERMISSION_ALLOW_EMOJI
+            # Add reaction buttons
+            try:
+                for emoji in _REACTION_EMOJIS:
+                    await perm_message.add_reaction(emoji)
+            except discord.DiscordException as e:
+                logger.error("Failed to add reaction buttons: %s", e)
+                return False
 
-            # Update the message to show the result
-            result_text = "✅ **Allowed**" if allowed else "❌ **Denied**"
-            with contextlib.suppress(discord.DiscordException):
-                await perm_message.edit(content=message_text + f"\n\n{result_text}")
+            # Wait for user reaction
+            try:
+                allowed = await asyncio.wait_for(future, timeout=PERMISSION_TIMEOUT_SECONDS)
+            except asyncio.TimeoutError:
+                # User didn't respond in time
+                with contextlib.suppress(discord.DiscordException):
+                    await perm_message.edit(
+                        content=message_text + "\n\n⏰ **Timed out** (auto-denied)"
+                    )
+                return False
+        finally:
+            self._pending_permissions.pop(perm_message.id, None)
 
-            return allowed
+        # Update the message to show the result
+        result_text = "✅ **Allowed**" if allowed else "❌ **Denied**"
+        with contextlib.suppress(discord.DiscordException):
+            await perm_message.edit(content=message_text + f"\n\n{result_text}")
 
-        except asyncio.TimeoutError:
-            # User didn't respond in time
-            with contextlib.suppress(discord.DiscordException):
-                await perm_message.edit(content=message_text + "\n\n⏰ **Timed out** (auto-denied)")
-            return False
+        return allowed
 
     async def _handle_passthrough_with_permissions(
         self,
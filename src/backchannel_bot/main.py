@@ -31,14 +31,17 @@ def main() -> None:
 
     # Load configuration (will raise ConfigurationError if required env vars missing)
     try:
-        config = Config()
+        config = Config.from_env()
         logger.info("Configuration loaded successfully")
     except ConfigurationError as e:
         logger.error("Configuration error: %s", e)
         sys.exit(1)
 
     # Create Claude client
-    claude_client = ClaudeClient()
+    claude_client = ClaudeClient(
+        session_timeout=config.claude_session_timeout,
+        cache_ttl=config.claude_response_cache_ttl,
+    )
 
     # Initialize and run the Discord bot
     bot = BackchannelBot(config=config, claude_client=claude_client)
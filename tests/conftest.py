@@ -0,0 +1,46 @@
+"""Shared fixtures for backchannel-bot tests."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from backchannel_bot.config import Config
+from backchannel_bot.discord_client import BackchannelBot
+from tests.fakes import FakeChannel, FakeClaudeClient
+
+
+@pytest.fixture
+def config(monkeypatch: pytest.MonkeyPatch) -> Config:
+    """A Config built from the minimal valid environment."""
+    monkeypatch.setenv("DISCORD_BOT_TOKEN", "test-token")
+    return Config.from_env()
+
+
+@pytest.fixture
+def claude_client() -> MagicMock:
+    """A ClaudeClient stand-in; each test sets up the calls it needs."""
+    return MagicMock()
+
+
+@pytest.fixture
+def bot(config: Config, claude_client: MagicMock) -> BackchannelBot:
+    """A BackchannelBot wired to the config and claude_client fixtures."""
+    return BackchannelBot(config=config, claude_client=claude_client)
+
+
+@pytest.fixture
+def channel() -> FakeChannel:
+    """A fresh FakeChannel."""
+    return FakeChannel()
+
+
+@pytest.fixture
+def fake_claude() -> FakeClaudeClient:
+    """A fresh FakeClaudeClient with no canned output."""
+    return FakeClaudeClient()
+
+
+@pytest.fixture
+def fake_bot(config: Config, fake_claude: FakeClaudeClient) -> BackchannelBot:
+    """A BackchannelBot wired to the fake_claude fixture."""
+    return BackchannelBot(config=config, claude_client=fake_claude)
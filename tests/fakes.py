@@ -0,0 +1,69 @@
+"""Hand-written fakes for the Discord channel and the Claude client."""
+
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+
+
+class _FakeTyping:
+    """Async context manager returned by FakeChannel.typing()."""
+
+    def __init__(self, channel: "FakeChannel") -> None:
+        self._channel = channel
+
+    async def __aenter__(self) -> "_FakeTyping":
+        self._channel.typing_active = True
+        self._channel.typing_count += 1
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> bool:
+        self._channel.typing_active = False
+        return False
+
+
+class FakeChannel:
+    """Minimal Discord channel that records what the bot sends to it."""
+
+    def __init__(self, channel_id: int = 12345) -> None:
+        self.id = channel_id
+        self.sent: list[str] = []
+        self.typing_active = False
+        self.typing_count = 0
+
+    async def send(self, content: str, **kwargs: object) -> SimpleNamespace:
+        self.sent.append(content)
+        return SimpleNamespace(id=len(self.sent), content=content)
+
+    def typing(self) -> _FakeTyping:
+        return _FakeTyping(self)
+
+
+@dataclass
+class FakeClaudeClient:
+    """ClaudeClient stand-in that replays canned output and records prompts.
+
+    Covers the calls BackchannelBot makes: run_claude_print_async,
+    list_claude_sessions and close.
+    """
+
+    response: str = ""
+    error: Exception | None = None
+    sessions: list[dict] = field(default_factory=list)
+    prompts: list[tuple[str, str]] = field(default_factory=list)
+
+    async def run_claude_print_async(
+        self,
+        prompt: str,
+        timeout: int = 300,
+        session_mode: str = "continue",
+        cache_response: bool = True,
+    ) -> str:
+        self.prompts.append((prompt, session_mode))
+        if self.error is not None:
+            raise self.error
+        return self.response
+
+    def list_claude_sessions(self, cwd: str | None = None, limit: int = 5) -> list[dict]:
+        return list(self.sessions)
+
+    async def close(self) -> None:
+        pass
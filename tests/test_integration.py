@@ -10,12 +10,23 @@ These tests verify the core functionality per PRD Success Criteria:
 - Permission requests are displayed in Discord (bcb-ygj)
 """
 
+import asyncio
+import json
 import os
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from backchannel_bot.claude_client import ClaudeClient, ClaudeError, PermissionRequest
+from backchannel_bot import claude_client as claude_client_module
+from backchannel_bot.claude_client import (
+    ClaudeClient,
+    ClaudeError,
+    ClaudeStreamSession,
+    PermissionRequest,
+)
 from backchannel_bot.config import Config, ConfigurationError
 from backchannel_bot.discord_client import (
     PERMISSION_ALLOW_EMOJI,
@@ -23,6 +34,7 @@ from backchannel_bot.discord_client import (
     BackchannelBot,
     chunk_message,
 )
+from tests.fakes import FakeChannel, FakeClaudeClient
 
 # =============================================================================
 # Test 1: Bot connects to Discord and responds to test messages
@@ -32,32 +44,16 @@ from backchannel_bot.discord_client import (
 class TestDiscordConnection:
     """Tests for Discord bot connection and message handling."""
 
-    def test_bot_initializes_with_valid_config(self) -> None:
+    def test_bot_initializes_with_valid_config(
+        self, bot: BackchannelBot, config: Config, claude_client: MagicMock
+    ) -> None:
         """Bot can be initialized with valid configuration."""
-        with patch.dict(
-            os.environ,
-            {
-                "DISCORD_BOT_TOKEN": "test-token",
-            },
-        ):
-            config = Config()
-            claude_client = MagicMock(spec=ClaudeClient)
-            bot = BackchannelBot(config=config, claude_client=claude_client)
-            assert bot.config == config
-            assert bot.claude_client == claude_client
+        assert bot.config == config
+        assert bot.claude_client == claude_client
 
-    def test_bot_has_message_content_intent(self) -> None:
+    def test_bot_has_message_content_intent(self, bot: BackchannelBot) -> None:
         """Bot requests message content intent (required for reading messages)."""
-        with patch.dict(
-            os.environ,
-            {
-                "DISCORD_BOT_TOKEN": "test-token",
-            },
-        ):
-            config = Config()
-            claude_client = MagicMock(spec=ClaudeClient)
-            bot = BackchannelBot(config=config, claude_client=claude_client)
-            assert bot.intents.message_content is True
+        assert bot.intents.message_content is True
 
 
 # =============================================================================
@@ -65,58 +61,385 @@ class TestDiscordConnection:
 # =============================================================================
 
 
+def _make_print_process(
+    stdout: bytes = b"Response\n", stderr: bytes = b"", returncode: int = 0
+) -> MagicMock:
+    """Build a fake one-shot `claude -p` process with the given outcome."""
+    process = MagicMock(returncode=returncode)
+    process.communicate = AsyncMock(return_value=(stdout, stderr))
+    return process
+
+
 class TestClaudeClient:
     """Tests for Claude Code client."""
 
-    def test_run_claude_print_calls_subprocess(self) -> None:
-        """ClaudeClient.run_claude_print executes claude -p command."""
+    @pytest.mark.asyncio
+    async def test_run_claude_print_runs_claude_p(self) -> None:
+        """ClaudeClient.run_claude_print_async runs claude -p as an asyncio subprocess."""
+        process = _make_print_process(b"Claude response\n")
+        client = ClaudeClient()
+        with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=process)) as mock_exec:
+            result = await client.run_claude_print_async("test prompt")
+
+        assert result == "Claude response"
+        mock_exec.assert_called_once()
+        call_args = mock_exec.call_args[0]
+        assert call_args[:2] == ("claude", "-p")
+        assert "--continue" in call_args
+
+    @pytest.mark.asyncio
+    async def test_run_claude_print_sends_prompt_on_stdin(self) -> None:
+        """ClaudeClient.run_claude_print_async pipes the prompt on stdin, not argv."""
+        process = _make_print_process()
+        client = ClaudeClient()
+        long_prompt = "line with 'quotes' and \"more\"\n" * 5000
+        with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=process)) as mock_exec:
+            await client.run_claude_print_async(long_prompt)
+
+        assert long_prompt not in mock_exec.call_args[0]
+        process.communicate.assert_awaited_once_with(long_prompt.encode("utf-8"))
+
+    @pytest.mark.asyncio
+    async def test_run_claude_print_replaces_invalid_utf8(self) -> None:
+        """ClaudeClient.run_claude_print_async tolerates undecodable bytes in output."""
+        process = _make_print_process(b"caf\xe9 \n\n")
+        client = ClaudeClient()
+        with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=process)):
+            assert await client.run_claude_print_async("test") == "caf\ufffd"
+
+    @pytest.mark.asyncio
+    async def test_run_claude_print_fresh_mode(self) -> None:
+        """ClaudeClient.run_claude_print_async with fresh mode doesn't add --continue."""
+        process = _make_print_process()
+        client = ClaudeClient()
+        with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=process)) as mock_exec:
+            await client.run_claude_print_async("test", session_mode="fresh")
+
+        call_args = mock_exec.call_args[0]
+        assert "--continue" not in call_args
+        assert "--resume" not in call_args
+
+    @pytest.mark.asyncio
+    async def test_run_claude_print_resume_mode(self) -> None:
+        """ClaudeClient.run_claude_print_async with resume mode adds --resume flag."""
+        process = _make_print_process()
         client = ClaudeClient()
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=0, stdout="Claude response\n")
-            result = client.run_claude_print("test prompt")
-            assert result == "Claude response"
-            mock_run.assert_called_once()
-            call_args = mock_run.call_args[0][0]
-            assert call_args[0] == "claude"
-            assert call_args[1] == "-p"
-            assert "test prompt" in call_args
-            assert "--continue" in call_args
-
-    def test_run_claude_print_fresh_mode(self) -> None:
-        """ClaudeClient.run_claude_print with fresh mode doesn't add --continue."""
+        with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=process)) as mock_exec:
+            await client.run_claude_print_async("test", session_mode="resume:abc-123-def")
+
+        call_args = mock_exec.call_args[0]
+        assert "--resume" in call_args
+        assert "abc-123-def" in call_args
+
+    @pytest.mark.asyncio
+    async def test_run_claude_print_raises_on_failure(self) -> None:
+        """A non-zero exit raises ClaudeError with the stderr text."""
+        process = _make_print_process(b"", b"error message", returncode=1)
         client = ClaudeClient()
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=0, stdout="Response\n")
-            client.run_claude_print("test", session_mode="fresh")
-            call_args = mock_run.call_args[0][0]
-            assert "--continue" not in call_args
-            assert "--resume" not in call_args
-
-    def test_run_claude_print_resume_mode(self) -> None:
-        """ClaudeClient.run_claude_print with resume mode adds --resume flag."""
+        with (
+            patch("asyncio.create_subprocess_exec", AsyncMock(return_value=process)),
+            pytest.raises(ClaudeError, match="Claude command failed: error message"),
+        ):
+            await client.run_claude_print_async("test")
+
+    @pytest.mark.asyncio
+    async def test_run_claude_print_raises_on_missing_claude(self) -> None:
+        """A missing claude binary raises ClaudeError."""
         client = ClaudeClient()
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=0, stdout="Response\n")
-            client.run_claude_print("test", session_mode="resume:abc-123-def")
-            call_args = mock_run.call_args[0][0]
-            assert "--resume" in call_args
-            assert "abc-123-def" in call_args
-
-    def test_run_claude_print_raises_on_failure(self) -> None:
-        """ClaudeClient.run_claude_print raises ClaudeError on command failure."""
+        with (
+            patch(
+                "asyncio.create_subprocess_exec",
+                AsyncMock(side_effect=FileNotFoundError("claude not found")),
+            ),
+            pytest.raises(ClaudeError, match="Claude Code is not installed"),
+        ):
+            await client.run_claude_print_async("test")
+
+    @pytest.mark.asyncio
+    async def test_response_cache_reuses_identical_prompts(self) -> None:
+        """With caching enabled, an identical prompt does not run claude again."""
+        process = _make_print_process(b"Cached\n")
+        client = ClaudeClient(cache_ttl=3600)
+        with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=process)) as mock_exec:
+            first = await client.run_claude_print_async("hello  there")
+            second = await client.run_claude_print_async("hello there")
+        assert first == second == "Cached"
+        mock_exec.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_response_cache_skips_failed_runs(self) -> None:
+        """A prompt whose run fails is not cached, so the retry runs claude again."""
+        failed = _make_print_process(b"", b"error message", returncode=1)
+        succeeded = _make_print_process(b"Answer\n")
+        client = ClaudeClient(cache_ttl=3600)
+        with patch(
+            "asyncio.create_subprocess_exec", AsyncMock(side_effect=[failed, succeeded])
+        ) as mock_exec:
+            with pytest.raises(ClaudeError):
+                await client.run_claude_print_async("hello")
+            retried = await client.run_claude_print_async("hello")
+            replayed = await client.run_claude_print_async("hello")
+
+        assert retried == replayed == "Answer"
+        assert mock_exec.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_response_cache_keeps_case(self) -> None:
+        """Prompts that differ only in case do not share a cached response."""
+        process = _make_print_process()
+        client = ClaudeClient(cache_ttl=3600)
+        with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=process)) as mock_exec:
+            await client.run_claude_print_async("rename Foo to foo")
+            await client.run_claude_print_async("rename foo to Foo")
+        assert mock_exec.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_response_cache_disabled_by_default(self) -> None:
+        """Without a cache TTL, every prompt runs claude."""
+        process = _make_print_process()
         client = ClaudeClient()
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=1, stderr="error message")
-            with pytest.raises(ClaudeError, match="Claude command failed"):
-                client.run_claude_print("test")
+        with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=process)) as mock_exec:
+            await client.run_claude_print_async("hello")
+            await client.run_claude_print_async("hello")
+        assert mock_exec.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_response_cache_skips_fresh_mode(self) -> None:
+        """Fresh-mode prompts always run claude, even with caching enabled."""
+        process = _make_print_process()
+        client = ClaudeClient(cache_ttl=3600)
+        with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=process)) as mock_exec:
+            await client.run_claude_print_async("hello", session_mode="fresh")
+            await client.run_claude_print_async("hello", session_mode="fresh")
+        assert mock_exec.call_count == 2
+
+    def test_list_claude_sessions_parses_only_newest(self, tmp_path: Path) -> None:
+        """list_claude_sessions returns the newest sessions and only reads those files."""
+        cwd = "/work/project"
+        sessions_dir = tmp_path / ".claude" / "projects" / cwd.replace("/", "-")
+        sessions_dir.mkdir(parents=True)
+        for i in range(7):
+            session_file = sessions_dir / f"{i:08d}-0000-0000-0000-000000000000.jsonl"
+            entry = {"type": "user", "message": {"content": f"prompt {i}"}}
+            session_file.write_text(json.dumps(entry) + "\n")
+            os.utime(session_file, (1_700_000_000 + i, 1_700_000_000 + i))
 
-    def test_run_claude_print_raises_on_missing_claude(self) -> None:
-        """ClaudeClient.run_claude_print raises ClaudeError when claude not installed."""
         client = ClaudeClient()
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = FileNotFoundError("claude not found")
-            with pytest.raises(ClaudeError, match="Claude Code is not installed"):
-                client.run_claude_print("test")
+        with (
+            patch("pathlib.Path.home", return_value=tmp_path),
+            patch(
+                "backchannel_bot.claude_client._read_first_prompt",
+                wraps=claude_client_module._read_first_prompt,
+            ) as mock_read,
+        ):
+            sessions = client.list_claude_sessions(cwd=cwd, limit=3)
+
+        assert [s["first_prompt"] for s in sessions] == ["prompt 6", "prompt 5", "prompt 4"]
+        assert mock_read.call_count == 3
+
+    def test_list_claude_sessions_skips_unreadable_files(self, tmp_path: Path) -> None:
+        """An unreadable session file is replaced by the next newest one."""
+        cwd = "/work/project"
+        sessions_dir = tmp_path / ".claude" / "projects" / cwd.replace("/", "-")
+        sessions_dir.mkdir(parents=True)
+        for i in range(4):
+            session_file = sessions_dir / f"{i:08d}-0000-0000-0000-000000000000.jsonl"
+            entry = {"type": "user", "message": {"content": f"prompt {i}"}}
+            session_file.write_text(json.dumps(entry) + "\n")
+            os.utime(session_file, (1_700_000_000 + i, 1_700_000_000 + i))
+
+        read_first_prompt = claude_client_module._read_first_prompt
+
+        def flaky_read(session_file: Path) -> str | None:
+            if session_file.stem.startswith("00000003"):
+                raise OSError("permission denied")
+            return read_first_prompt(session_file)
+
+        client = ClaudeClient()
+        with (
+            patch("pathlib.Path.home", return_value=tmp_path),
+            patch("backchannel_bot.claude_client._read_first_prompt", side_effect=flaky_read),
+        ):
+            sessions = client.list_claude_sessions(cwd=cwd, limit=2)
+
+        assert [s["first_prompt"] for s in sessions] == ["prompt 2", "prompt 1"]
+
+    @pytest.mark.asyncio
+    async def test_list_claude_sessions_reuses_recent_listing(self, tmp_path: Path) -> None:
+        """A second listing within the cache window does not rescan the directory."""
+        cwd = "/work/project"
+        sessions_dir = tmp_path / ".claude" / "projects" / cwd.replace("/", "-")
+        sessions_dir.mkdir(parents=True)
+        entry = {"type": "user", "message": {"content": "prompt"}}
+        (sessions_dir / f"{'0' * 8}-0000-0000-0000-000000000000.jsonl").write_text(
+            json.dumps(entry) + "\n"
+        )
+
+        client = ClaudeClient()
+        with (
+            patch("pathlib.Path.home", return_value=tmp_path),
+            patch.object(
+                client, "_scan_claude_sessions", wraps=client._scan_claude_sessions
+            ) as scan,
+            patch(
+                "asyncio.create_subprocess_exec",
+                AsyncMock(return_value=_make_print_process(b"ok")),
+            ),
+        ):
+            first = client.list_claude_sessions(cwd=cwd)
+            second = client.list_claude_sessions(cwd=cwd)
+            assert scan.call_count == 1
+
+            # Running Claude may create or update a session, so it drops the listing
+            await client.run_claude_print_async("hello")
+            client.list_claude_sessions(cwd=cwd)
+            assert scan.call_count == 2
+
+        assert first == second
+        assert first[0]["first_prompt"] == "prompt"
+
+
+class TestClaudeStreamSession:
+    """Tests for the stream-json Claude session."""
+
+    @pytest.mark.asyncio
+    async def test_start_sends_prompt_on_stdin(self) -> None:
+        """ClaudeStreamSession.start writes the prompt to stdin as a user message."""
+        result_line = json.dumps({"type": "result", "result": "Done"}).encode() + b"\n"
+        process = MagicMock()
+        process.returncode = 0
+        process.stdin.write = MagicMock()
+        process.stdin.drain = AsyncMock()
+        process.stdout.readline = AsyncMock(side_effect=[result_line, b""])
+
+        with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=process)) as mock_exec:
+            session = ClaudeStreamSession()
+            messages = [msg async for msg in session.start("hello there")]
+
+        assert "hello there" not in mock_exec.call_args[0]
+        sent = json.loads(process.stdin.write.call_args[0][0])
+        assert sent["type"] == "user"
+        assert sent["message"]["content"][0]["text"] == "hello there"
+        assert messages[-1].result == "Done"
+        assert messages[-1].is_complete
+
+
+def _make_stream_process(*results: str, stderr: bytes = b"") -> MagicMock:
+    """Build a fake stream-json Claude process that answers with the given results."""
+    lines = [json.dumps({"type": "system", "subtype": "init"}).encode() + b"\n"]
+    for result in results:
+        lines.append(json.dumps({"type": "result", "result": result}).encode() + b"\n")
+    process = MagicMock()
+    process.returncode = None
+    process.stdin.write = MagicMock()
+    process.stdin.drain = AsyncMock()
+    process.stdout.readline = AsyncMock(side_effect=[*lines, b""])
+    process.stderr.read = AsyncMock(side_effect=[stderr, b""] if stderr else [b""])
+    process.wait = AsyncMock()
+    return process
+
+
+class TestPersistentClaudeSession:
+    """Tests for reusing one Claude process across prompts."""
+
+    @pytest.mark.asyncio
+    async def test_prompts_reuse_one_process(self) -> None:
+        """Consecutive prompts in continue mode are sent to the same process."""
+        process = _make_stream_process("First answer", "Second answer")
+        client = ClaudeClient(session_timeout=600)
+        with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=process)) as mock_exec:
+            first = await client.run_claude_print_async("one", session_mode="continue")
+            second = await client.run_claude_print_async("two", session_mode="continue")
+
+        assert (first, second) == ("First answer", "Second answer")
+        mock_exec.assert_called_once()
+        assert "--continue" in mock_exec.call_args[0]
+        assert process.stdin.write.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_session_mode_change_restarts_process(self) -> None:
+        """Switching session mode starts a new process with the new flags."""
+        first = _make_stream_process("Continued")
+        second = _make_stream_process("Resumed")
+        client = ClaudeClient(session_timeout=600)
+        with patch(
+            "asyncio.create_subprocess_exec", AsyncMock(side_effect=[first, second])
+        ) as mock_exec:
+            await client.run_claude_print_async("one", session_mode="continue")
+            result = await client.run_claude_print_async("two", session_mode="resume:abc")
+
+        assert result == "Resumed"
+        assert mock_exec.call_count == 2
+        assert "--resume" in mock_exec.call_args[0]
+        first.terminate.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_turn_restarts_process(self) -> None:
+        """A turn that fails before its result closes the process for the next prompt."""
+        first = _make_stream_process("answer to one")
+        first.stdout.readline = AsyncMock(side_effect=ValueError("line too long"))
+        second = _make_stream_process("answer to two")
+        client = ClaudeClient(session_timeout=600)
+        with patch("asyncio.create_subprocess_exec", AsyncMock(side_effect=[first, second])):
+            with pytest.raises(ValueError):
+                await client.run_claude_print_async("one", session_mode="continue")
+            result = await client.run_claude_print_async("two", session_mode="continue")
+
+        assert result == "answer to two"
+        first.terminate.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_error_result_keeps_process(self) -> None:
+        """A turn that ends in an error result leaves the process running."""
+        process = _make_stream_process("Second answer")
+        error_line = json.dumps({"type": "result", "is_error": True, "result": "boom"}).encode()
+        init_line, *rest = process.stdout.readline.side_effect
+        process.stdout.readline = AsyncMock(side_effect=[init_line, error_line + b"\n", *rest])
+        client = ClaudeClient(session_timeout=600)
+        with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=process)) as mock_exec:
+            with pytest.raises(ClaudeError, match="Claude command failed: boom"):
+                await client.run_claude_print_async("one", session_mode="continue")
+            result = await client.run_claude_print_async("two", session_mode="continue")
+
+        assert result == "Second answer"
+        mock_exec.assert_called_once()
+        process.terminate.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_session_exit_reports_stderr(self) -> None:
+        """When the process exits mid-turn, its stderr is included in the error."""
+        process = _make_stream_process(stderr=b"No conversation found with session ID: abc\n")
+        client = ClaudeClient(session_timeout=600)
+        with (
+            patch("asyncio.create_subprocess_exec", AsyncMock(return_value=process)),
+            pytest.raises(ClaudeError, match="No conversation found with session ID: abc"),
+        ):
+            await client.run_claude_print_async("hi", session_mode="resume:abc")
+
+    @pytest.mark.asyncio
+    async def test_response_cache_replays_session_answers(self) -> None:
+        """With caching enabled, a repeated prompt is not sent to the session again."""
+        process = _make_stream_process("Session answer")
+        client = ClaudeClient(session_timeout=600, cache_ttl=3600)
+        with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=process)):
+            first = await client.run_claude_print_async("hello")
+            second = await client.run_claude_print_async("hello")
+
+        assert first == second == "Session answer"
+        process.stdin.write.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_fresh_mode_spawns_per_prompt(self) -> None:
+        """Fresh mode never uses the persistent process."""
+        process = MagicMock(returncode=0)
+        process.communicate = AsyncMock(return_value=(b"Fresh\n", b""))
+        client = ClaudeClient(session_timeout=600)
+        with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=process)) as mock_exec:
+            result = await client.run_claude_print_async("hi", session_mode="fresh")
+
+        assert result == "Fresh"
+        assert "stream-json" not in mock_exec.call_args[0]
+        process.communicate.assert_awaited_once_with(b"hi")
 
 
 # =============================================================================
@@ -128,67 +451,44 @@ class TestRoundTrip:
     """Tests for the full message round-trip flow using claude -p."""
 
     @pytest.mark.asyncio
-    async def test_passthrough_runs_claude_print_and_returns_response(self) -> None:
-        """Messages are sent to Claude via run_claude_print and responses relayed back."""
-        with patch.dict(
-            os.environ,
-            {
-                "DISCORD_BOT_TOKEN": "test-token",
-            },
-        ):
-            config = Config()
-            claude_client = MagicMock(spec=ClaudeClient)
-            bot = BackchannelBot(config=config, claude_client=claude_client)
-
-            # Mock Claude print mode response
-            claude_client.run_claude_print.return_value = "Hi there! How can I help you?"
+    async def test_passthrough_runs_claude_print_and_returns_response(
+        self, fake_bot: BackchannelBot, fake_claude: FakeClaudeClient, channel: FakeChannel
+    ) -> None:
+        """Messages are sent to Claude via run_claude_print_async and responses relayed back."""
+        fake_claude.response = "Hi there! How can I help you?"
 
-            # Mock Discord message
-            message = MagicMock()
-            message.author.bot = False
-            message.channel.id = 12345
-            message.author.id = 67890
-            message.content = "hello"
-            message.channel.typing = MagicMock(return_value=AsyncMock())
-            message.channel.send = AsyncMock()
+        # Mock Discord message
+        message = MagicMock()
+        message.author.bot = False
+        message.channel = channel
+        message.author.id = 67890
+        message.content = "hello"
 
-            await bot._handle_passthrough(message)
+        await fake_bot._handle_passthrough(message)
 
-            # Verify Claude print mode was called with the message and session mode
-            claude_client.run_claude_print.assert_called_once_with("hello", session_mode="continue")
+        # Verify Claude print mode was called with the message and session mode
+        assert fake_claude.prompts == [("hello", "continue")]
 
-            # Verify response was sent to Discord
-            message.channel.send.assert_called()
-            call_args = message.channel.send.call_args[0][0]
-            assert "Hi there!" in call_args
+        # Verify response was sent to Discord
+        assert channel.sent == ["Hi there! How can I help you?"]
 
     @pytest.mark.asyncio
-    async def test_passthrough_handles_claude_error(self) -> None:
+    async def test_passthrough_handles_claude_error(
+        self, fake_bot: BackchannelBot, fake_claude: FakeClaudeClient, channel: FakeChannel
+    ) -> None:
         """Claude errors during passthrough are reported to Discord."""
-        with patch.dict(
-            os.environ,
-            {
-                "DISCORD_BOT_TOKEN": "test-token",
-            },
-        ):
-            config = Config()
-            claude_client = MagicMock(spec=ClaudeClient)
-            bot = BackchannelBot(config=config, claude_client=claude_client)
-
-            claude_client.run_claude_print.side_effect = ClaudeError("command failed")
+        fake_claude.error = ClaudeError("command failed")
 
-            message = MagicMock()
-            message.author.bot = False
-            message.channel.id = 12345
-            message.author.id = 67890
-            message.content = "hello"
-            message.channel.send = AsyncMock()
+        message = MagicMock()
+        message.author.bot = False
+        message.channel = channel
+        message.author.id = 67890
+        message.content = "hello"
 
-            await bot._handle_passthrough(message)
+        await fake_bot._handle_passthrough(message)
 
-            # Verify error message sent
-            call_args = message.channel.send.call_args[0][0]
-            assert "Claude error" in call_args
+        # Verify error message sent
+        assert "Claude error" in channel.sent[-1]
 
 
 # =============================================================================
@@ -200,109 +500,80 @@ class TestSessionCommand:
     """Tests for the !session command functionality."""
 
     @pytest.mark.asyncio
-    async def test_session_list_shows_full_ids(self) -> None:
+    async def test_session_list_shows_full_ids(
+        self, fake_bot: BackchannelBot, fake_claude: FakeClaudeClient, channel: FakeChannel
+    ) -> None:
         """Session list shows full UUIDs, not truncated IDs."""
-        from datetime import datetime
-
-        with patch.dict(
-            os.environ,
+        # Mock session list with full UUIDs
+        full_uuid = "a1b2c3d4-e5f6-7890-abcd-ef1234567890"
+        fake_claude.sessions = [
             {
-                "DISCORD_BOT_TOKEN": "test-token",
-            },
-        ):
-            config = Config()
-            claude_client = MagicMock(spec=ClaudeClient)
-            bot = BackchannelBot(config=config, claude_client=claude_client)
-
-            # Mock session list with full UUIDs
-            full_uuid = "a1b2c3d4-e5f6-7890-abcd-ef1234567890"
-            claude_client.list_claude_sessions.return_value = [
-                {
-                    "id": full_uuid,
-                    "timestamp": datetime(2026, 2, 1, 15, 30),
-                    "first_prompt": "Fix the login bug",
-                }
-            ]
+                "id": full_uuid,
+                "timestamp": datetime(2026, 2, 1, 15, 30),
+                "first_prompt": "Fix the login bug",
+            }
+        ]
 
-            message = MagicMock()
-            message.content = "!session"
-            message.channel.send = AsyncMock()
+        message = MagicMock()
+        message.content = "!session"
+        message.channel = channel
 
-            await bot._handle_session_command(message)
+        await fake_bot._handle_session_command(message)
 
-            # Verify full UUID is in output
-            call_args = message.channel.send.call_args[0][0]
-            assert full_uuid in call_args
-            assert "a1b2c3d4..." not in call_args  # Should NOT be truncated
+        # Verify full UUID is in output
+        assert full_uuid in channel.sent[-1]
+        assert "a1b2c3d4..." not in channel.sent[-1]  # Should NOT be truncated
 
     @pytest.mark.asyncio
-    async def test_session_numeric_selection(self) -> None:
+    async def test_session_numeric_selection(
+        self,
+        fake_bot: BackchannelBot,
+        config: Config,
+        fake_claude: FakeClaudeClient,
+        channel: FakeChannel,
+    ) -> None:
         """Users can select session by number (e.g., !session 1)."""
-        from datetime import datetime
-
-        with patch.dict(
-            os.environ,
+        full_uuid = "a1b2c3d4-e5f6-7890-abcd-ef1234567890"
+        fake_claude.sessions = [
             {
-                "DISCORD_BOT_TOKEN": "test-token",
-            },
-        ):
-            config = Config()
-            claude_client = MagicMock(spec=ClaudeClient)
-            bot = BackchannelBot(config=config, claude_client=claude_client)
+                "id": full_uuid,
+                "timestamp": datetime(2026, 2, 1, 15, 30),
+                "first_prompt": "Fix the login bug",
+            }
+        ]
 
-            full_uuid = "a1b2c3d4-e5f6-7890-abcd-ef1234567890"
-            claude_client.list_claude_sessions.return_value = [
-                {
-                    "id": full_uuid,
-                    "timestamp": datetime(2026, 2, 1, 15, 30),
-                    "first_prompt": "Fix the login bug",
-                }
-            ]
+        message = MagicMock()
+        message.content = "!session 1"
+        message.channel = channel
 
-            message = MagicMock()
-            message.content = "!session 1"
-            message.channel.send = AsyncMock()
+        await fake_bot._handle_session_command(message)
 
-            await bot._handle_session_command(message)
-
-            # Verify session mode was set
-            assert config.claude_session_mode == f"resume:{full_uuid}"
-            call_args = message.channel.send.call_args[0][0]
-            assert "✅" in call_args
+        # Verify session mode was set
+        assert config.claude_session_mode == f"resume:{full_uuid}"
+        assert "✅" in channel.sent[-1]
 
     @pytest.mark.asyncio
-    async def test_session_invalid_number(self) -> None:
+    async def test_session_invalid_number(
+        self, fake_bot: BackchannelBot, fake_claude: FakeClaudeClient, channel: FakeChannel
+    ) -> None:
         """Invalid session number gives helpful error."""
-        from datetime import datetime
-
-        with patch.dict(
-            os.environ,
+        fake_claude.sessions = [
             {
-                "DISCORD_BOT_TOKEN": "test-token",
-            },
-        ):
-            config = Config()
-            claude_client = MagicMock(spec=ClaudeClient)
-            bot = BackchannelBot(config=config, claude_client=claude_client)
+                "id": "a1b2c3d4-e5f6-7890-abcd-ef1234567890",
+                "timestamp": datetime(2026, 2, 1, 15, 30),
+                "first_prompt": "Fix the login bug",
+            }
+        ]
 
-            claude_client.list_claude_sessions.return_value = [
-                {
-                    "id": "a1b2c3d4-e5f6-7890-abcd-ef1234567890",
-                    "timestamp": datetime(2026, 2, 1, 15, 30),
-                    "first_prompt": "Fix the login bug",
-                }
-            ]
-
-            message = MagicMock()
-            message.content = "!session 99"  # Invalid number
-            message.channel.send = AsyncMock()
+        message = MagicMock()
+        message.content = "!session 99"  # Invalid number
+        message.channel = channel
 
-            await bot._handle_session_command(message)
+        await fake_bot._handle_session_command(message)
 
-            # Verify error message
-            call_args = message.channel.send.call_args[0][0]
-            assert "❌" in call_args
-            assert "Invalid session number" in call_args
+        # Verify error message
+        assert "❌" in channel.sent[-1]
+        assert "Invalid session number" in channel.sent[-1]
 
 
 # =============================================================================
@@ -355,6 +626,11 @@ class TestMessageChunking:
         for chunk in result:
             assert len(chunk) <= 100
 
+    def test_chunk_boundaries_drop_separating_whitespace(self) -> None:
+        """Whitespace at a split point is dropped; hard splits keep every character."""
+        assert chunk_message("aaaa bbbb\n\n  cccc dd", max_size=5) == ["aaaa", "bbbb", "cccc", "dd"]
+        assert chunk_message("x" * 12, max_size=5) == ["xxxxx", "xxxxx", "xx"]
+
 
 # =============================================================================
 # Test 5: Typing indicator shows while waiting for response
@@ -365,36 +641,29 @@ class TestTypingIndicator:
     """Tests for typing indicator during response wait."""
 
     @pytest.mark.asyncio
-    async def test_typing_indicator_shown_during_claude_call(self) -> None:
+    async def test_typing_indicator_shown_during_claude_call(
+        self, bot: BackchannelBot, claude_client: MagicMock, channel: FakeChannel
+    ) -> None:
         """Typing indicator is shown while waiting for Claude response."""
-        with patch.dict(
-            os.environ,
-            {
-                "DISCORD_BOT_TOKEN": "test-token",
-            },
-        ):
-            config = Config()
-            claude_client = MagicMock(spec=ClaudeClient)
-            bot = BackchannelBot(config=config, claude_client=claude_client)
+        typing_during_call = []
 
-            # Mock Claude print mode response
-            claude_client.run_claude_print.return_value = "Response from Claude"
+        async def run_claude(prompt: str, session_mode: str) -> str:
+            typing_during_call.append(channel.typing_active)
+            return "Response from Claude"
 
-            # Create async context manager mock for typing
-            typing_context = AsyncMock()
-            typing_context.__aenter__ = AsyncMock()
-            typing_context.__aexit__ = AsyncMock()
+        claude_client.run_claude_print_async = AsyncMock(side_effect=run_claude)
 
-            message = MagicMock()
-            message.author.bot = False
-            message.content = "test"
-            message.channel.typing = MagicMock(return_value=typing_context)
-            message.channel.send = AsyncMock()
+        message = MagicMock()
+        message.author.bot = False
+        message.content = "test"
+        message.channel = channel
 
-            await bot._handle_passthrough(message)
+        await bot._handle_passthrough(message)
 
-            # Verify typing() was called on the channel
-            message.channel.typing.assert_called()
+        # Typing was shown while Claude ran and cleared afterwards
+        assert typing_during_call == [True]
+        assert not channel.typing_active
+        assert channel.sent == ["Response from Claude"]
 
 
 # =============================================================================
@@ -411,7 +680,7 @@ class TestErrorHandling:
             patch.dict(os.environ, {}, clear=True),
             pytest.raises(ConfigurationError, match="DISCORD_BOT_TOKEN"),
         ):
-            Config()
+            Config.from_env()
 
     def test_non_numeric_channel_id_raises_config_error(self) -> None:
         """Non-numeric DISCORD_CHANNEL_ID raises ConfigurationError."""
@@ -425,7 +694,7 @@ class TestErrorHandling:
             ),
             pytest.raises(ConfigurationError, match="DISCORD_CHANNEL_ID must be a numeric"),
         ):
-            Config()
+            Config.from_env()
 
     def test_non_numeric_user_id_raises_config_error(self) -> None:
         """Non-numeric DISCORD_ALLOWED_USER_ID raises ConfigurationError."""
@@ -439,7 +708,36 @@ class TestErrorHandling:
             ),
             pytest.raises(ConfigurationError, match="DISCORD_ALLOWED_USER_ID must be a numeric"),
         ):
-            Config()
+            Config.from_env()
+
+    def test_non_ascii_digit_channel_id_raises_config_error(self) -> None:
+        """DISCORD_CHANNEL_ID made of non-ASCII digits raises ConfigurationError."""
+        with (
+            patch.dict(
+                os.environ,
+                {
+                    "DISCORD_BOT_TOKEN": "test-token",
+                    "DISCORD_CHANNEL_ID": "١٢٣٤٥٦٧٨٩٠١٢٣٤٥٦٧٨",
+                },
+            ),
+            pytest.raises(ConfigurationError, match="DISCORD_CHANNEL_ID must be a numeric"),
+        ):
+            Config.from_env()
+
+    def test_invalid_session_timeout_raises_config_error(self) -> None:
+        """Non-numeric or negative CLAUDE_SESSION_TIMEOUT raises ConfigurationError."""
+        for value in ("soon", "-5"):
+            with (
+                patch.dict(
+                    os.environ,
+                    {
+                        "DISCORD_BOT_TOKEN": "test-token",
+                        "CLAUDE_SESSION_TIMEOUT": value,
+                    },
+                ),
+                pytest.raises(ConfigurationError, match="CLAUDE_SESSION_TIMEOUT"),
+            ):
+                Config.from_env()
 
     def test_numeric_discord_ids_are_accepted(self) -> None:
         """Numeric Discord IDs are accepted."""
@@ -451,10 +749,18 @@ class TestErrorHandling:
                 "DISCORD_ALLOWED_USER_ID": "987654321098765432",
             },
         ):
-            config = Config()
+            config = Config.from_env()
             assert config.discord_channel_id == "123456789012345678"
             assert config.discord_allowed_user_id == "987654321098765432"
 
+    def test_config_reads_explicit_environment(self) -> None:
+        """from_env validates the given mapping instead of os.environ."""
+        with patch.dict(os.environ, {"CLAUDE_SESSION_MODE": "bogus"}):
+            config = Config.from_env({"DISCORD_BOT_TOKEN": "t", "CLAUDE_SESSION_MODE": "fresh"})
+        assert config.discord_bot_token == "t"
+        assert config.claude_session_mode == "fresh"
+        assert config.claude_session_timeout == 0
+
     def test_unset_discord_ids_are_none(self) -> None:
         """Unset Discord IDs default to None without error."""
         with patch.dict(
@@ -464,44 +770,37 @@ class TestErrorHandling:
             },
             clear=True,
         ):
-            config = Config()
+            config = Config.from_env()
             assert config.discord_channel_id is None
             assert config.discord_allowed_user_id is None
 
-    def test_claude_not_installed_raises_error(self) -> None:
+    @pytest.mark.asyncio
+    async def test_claude_not_installed_raises_error(self) -> None:
         """Missing claude binary raises ClaudeError."""
         client = ClaudeClient()
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = FileNotFoundError()
-            with pytest.raises(ClaudeError, match="Claude Code is not installed"):
-                client.run_claude_print("test")
-
-    @pytest.mark.asyncio
-    async def test_claude_print_failure_reports_error(self) -> None:
-        """Failed run_claude_print reports error to Discord."""
-        with patch.dict(
-            os.environ,
-            {
-                "DISCORD_BOT_TOKEN": "test-token",
-            },
+        with (
+            patch("asyncio.create_subprocess_exec", AsyncMock(side_effect=FileNotFoundError())),
+            pytest.raises(ClaudeError, match="Claude Code is not installed"),
         ):
-            config = Config()
-            claude_client = MagicMock(spec=ClaudeClient)
-            bot = BackchannelBot(config=config, claude_client=claude_client)
+            await client.run_claude_print_async("test")
 
-            # Simulate Claude command failure
-            claude_client.run_claude_print.side_effect = ClaudeError("Claude command failed")
+    @pytest.mark.asyncio
+    async def test_claude_print_failure_reports_error(
+        self, fake_bot: BackchannelBot, fake_claude: FakeClaudeClient, channel: FakeChannel
+    ) -> None:
+        """Failed run_claude_print_async reports error to Discord."""
+        # Simulate Claude command failure
+        fake_claude.error = ClaudeError("Claude command failed")
 
-            message = MagicMock()
-            message.author.bot = False
-            message.content = "test"
-            message.channel.send = AsyncMock()
+        message = MagicMock()
+        message.author.bot = False
+        message.content = "test"
+        message.channel = channel
 
-            await bot._handle_passthrough(message)
+        await fake_bot._handle_passthrough(message)
 
-            # Verify error message sent
-            call_args = message.channel.send.call_args[0][0]
-            assert "Claude error" in call_args
+        # Verify error message sent
+        assert "Claude error" in channel.sent[-1]
 
 
 # =============================================================================
@@ -513,234 +812,173 @@ class TestPermissionRequestDisplay:
     """Tests for permission request display functionality."""
 
     @pytest.mark.asyncio
-    async def test_format_bash_permission_request(self) -> None:
+    async def test_format_bash_permission_request(self, bot: BackchannelBot) -> None:
         """Bash permission requests are formatted correctly."""
-        with patch.dict(
-            os.environ,
-            {
-                "DISCORD_BOT_TOKEN": "test-token",
+        perm_req = PermissionRequest(
+            tool_name="Bash",
+            tool_use_id="test-123",
+            tool_input={
+                "command": "rm -rf /tmp/test",
+                "description": "Delete test files",
             },
-        ):
-            config = Config()
-            claude_client = MagicMock(spec=ClaudeClient)
-            bot = BackchannelBot(config=config, claude_client=claude_client)
-
-            perm_req = PermissionRequest(
-                tool_name="Bash",
-                tool_use_id="test-123",
-                tool_input={
-                    "command": "rm -rf /tmp/test",
-                    "description": "Delete test files",
-                },
-            )
+        )
 
-            formatted = await bot._format_permission_request(perm_req)
+        formatted = await bot._format_permission_request(perm_req)
 
-            assert "Permission Request" in formatted
-            assert "Bash command" in formatted
-            assert "rm -rf /tmp/test" in formatted
-            assert "Delete test files" in formatted
-            assert PERMISSION_ALLOW_EMOJI in formatted
-            assert PERMISSION_DENY_EMOJI in formatted
+        assert "Permission Request" in formatted
+        assert "Bash command" in formatted
+        assert "rm -rf /tmp/test" in formatted
+        assert "Delete test files" in formatted
+        assert PERMISSION_ALLOW_EMOJI in formatted
+        assert PERMISSION_DENY_EMOJI in formatted
 
     @pytest.mark.asyncio
-    async def test_format_write_permission_request(self) -> None:
+    async def test_format_write_permission_request(self, bot: BackchannelBot) -> None:
         """Write permission requests are formatted correctly."""
-        with patch.dict(
-            os.environ,
-            {
-                "DISCORD_BOT_TOKEN": "test-token",
+        perm_req = PermissionRequest(
+            tool_name="Write",
+            tool_use_id="test-456",
+            tool_input={
+                "file_path": "/tmp/hello.txt",
+                "content": "Hello, world!",
             },
-        ):
-            config = Config()
-            claude_client = MagicMock(spec=ClaudeClient)
-            bot = BackchannelBot(config=config, claude_client=claude_client)
-
-            perm_req = PermissionRequest(
-                tool_name="Write",
-                tool_use_id="test-456",
-                tool_input={
-                    "file_path": "/tmp/hello.txt",
-                    "content": "Hello, world!",
-                },
-            )
+        )
 
-            formatted = await bot._format_permission_request(perm_req)
+        formatted = await bot._format_permission_request(perm_req)
 
-            assert "Permission Request" in formatted
-            assert "write to file" in formatted
-            assert "/tmp/hello.txt" in formatted
-            assert "Hello, world!" in formatted
+        assert "Permission Request" in formatted
+        assert "write to file" in formatted
+        assert "/tmp/hello.txt" in formatted
+        assert "Hello, world!" in formatted
 
     @pytest.mark.asyncio
-    async def test_format_edit_permission_request(self) -> None:
+    async def test_format_edit_permission_request(self, bot: BackchannelBot) -> None:
         """Edit permission requests are formatted correctly."""
-        with patch.dict(
-            os.environ,
-            {
-                "DISCORD_BOT_TOKEN": "test-token",
+        perm_req = PermissionRequest(
+            tool_name="Edit",
+            tool_use_id="test-789",
+            tool_input={
+                "file_path": "/tmp/config.py",
+                "old_string": "DEBUG = False",
+                "new_string": "DEBUG = True",
             },
-        ):
-            config = Config()
-            claude_client = MagicMock(spec=ClaudeClient)
-            bot = BackchannelBot(config=config, claude_client=claude_client)
-
-            perm_req = PermissionRequest(
-                tool_name="Edit",
-                tool_use_id="test-789",
-                tool_input={
-                    "file_path": "/tmp/config.py",
-                    "old_string": "DEBUG = False",
-                    "new_string": "DEBUG = True",
-                },
-            )
+        )
 
-            formatted = await bot._format_permission_request(perm_req)
+        formatted = await bot._format_permission_request(perm_req)
 
-            assert "Permission Request" in formatted
-            assert "edit file" in formatted
-            assert "/tmp/config.py" in formatted
-            assert "DEBUG = False" in formatted
-            assert "DEBUG = True" in formatted
+        assert "Permission Request" in formatted
+        assert "edit file" in formatted
+        assert "/tmp/config.py" in formatted
+        assert "DEBUG = False" in formatted
+        assert "DEBUG = True" in formatted
 
     @pytest.mark.asyncio
-    async def test_format_generic_permission_request(self) -> None:
+    async def test_format_generic_permission_request(self, bot: BackchannelBot) -> None:
         """Generic/unknown tool permission requests are formatted correctly."""
-        with patch.dict(
-            os.environ,
-            {
-                "DISCORD_BOT_TOKEN": "test-token",
-            },
-        ):
-            config = Config()
-            claude_client = MagicMock(spec=ClaudeClient)
-            bot = BackchannelBot(config=config, claude_client=claude_client)
+        perm_req = PermissionRequest(
+            tool_name="CustomTool",
+            tool_use_id="test-abc",
+            tool_input={"param1": "value1", "param2": "value2"},
+        )
 
-            perm_req = PermissionRequest(
-                tool_name="CustomTool",
-                tool_use_id="test-abc",
-                tool_input={"param1": "value1", "param2": "value2"},
-            )
+        formatted = await bot._format_permission_request(perm_req)
 
-            formatted = await bot._format_permission_request(perm_req)
-
-            assert "Permission Request" in formatted
-            assert "CustomTool" in formatted
-            assert "param1" in formatted
-            assert "value1" in formatted
+        assert "Permission Request" in formatted
+        assert "CustomTool" in formatted
+        assert "param1" in formatted
+        assert "value1" in formatted
 
 
 class TestPermissionRequestFlow:
     """Tests for the permission request flow."""
 
+    @staticmethod
+    def _make_channel(message_id: int = 111) -> tuple[MagicMock, AsyncMock]:
+        """Build a channel whose send() returns a permission message with the given ID."""
+        mock_message = AsyncMock()
+        mock_message.id = message_id
+        mock_channel = MagicMock()
+        mock_channel.send = AsyncMock(return_value=mock_message)
+        return mock_channel, mock_message
+
+    @staticmethod
+    async def _react(bot: BackchannelBot, message_id: int, user_id: int, emoji: str) -> None:
+        """Deliver a reaction once the prompt for message_id is waiting for one."""
+        while message_id not in bot._pending_permissions:
+            await asyncio.sleep(0)
+        payload = SimpleNamespace(message_id=message_id, user_id=user_id, emoji=emoji)
+        await bot.on_raw_reaction_add(payload)
+
     @pytest.mark.asyncio
-    async def test_permission_request_adds_reactions(self) -> None:
+    async def test_permission_request_adds_reactions(self, bot: BackchannelBot) -> None:
         """Permission request message gets both reaction buttons added."""
-        with patch.dict(
-            os.environ,
-            {
-                "DISCORD_BOT_TOKEN": "test-token",
-            },
-        ):
-            config = Config()
-            claude_client = MagicMock(spec=ClaudeClient)
-            bot = BackchannelBot(config=config, claude_client=claude_client)
-
-            # Mock the channel and message
-            mock_message = AsyncMock()
-            mock_message.add_reaction = AsyncMock()
-
-            mock_channel = MagicMock()
-            mock_channel.send = AsyncMock(return_value=mock_message)
-
-            # Mock wait_for to simulate user allowing
-            bot.wait_for = AsyncMock(
-                return_value=(MagicMock(emoji=PERMISSION_ALLOW_EMOJI), MagicMock())
-            )
-
-            perm_req = PermissionRequest(
-                tool_name="Bash",
-                tool_use_id="test-123",
-                tool_input={"command": "ls"},
-            )
-
-            result = await bot._request_permission(mock_channel, perm_req, 12345)
-
-            # Verify reactions were added
-            assert mock_message.add_reaction.call_count == 2
-            calls = [call[0][0] for call in mock_message.add_reaction.call_args_list]
-            assert PERMISSION_ALLOW_EMOJI in calls
-            assert PERMISSION_DENY_EMOJI in calls
-
-            # User allowed
-            assert result is True
+        mock_channel, mock_message = self._make_channel()
+        perm_req = PermissionRequest(
+            tool_name="Bash",
+            tool_use_id="test-123",
+            tool_input={"command": "ls"},
+        )
+
+        request = asyncio.create_task(bot._request_permission(mock_channel, perm_req, 12345))
+        await self._react(bot, 111, 12345, PERMISSION_ALLOW_EMOJI)
+        result = await request
+
+        # Verify reactions were added
+        assert mock_message.add_reaction.call_count == 2
+        calls = [call[0][0] for call in mock_message.add_reaction.call_args_list]
+        assert PERMISSION_ALLOW_EMOJI in calls
+        assert PERMISSION_DENY_EMOJI in calls
+
+        # User allowed, and the prompt is no longer pending
+        assert result is True
+        assert bot._pending_permissions == {}
 
     @pytest.mark.asyncio
-    async def test_permission_request_deny_returns_false(self) -> None:
+    async def test_permission_request_deny_returns_false(self, bot: BackchannelBot) -> None:
         """Permission request returns False when user denies."""
-        with patch.dict(
-            os.environ,
-            {
-                "DISCORD_BOT_TOKEN": "test-token",
-            },
-        ):
-            config = Config()
-            claude_client = MagicMock(spec=ClaudeClient)
-            bot = BackchannelBot(config=config, claude_client=claude_client)
-
-            mock_message = AsyncMock()
-            mock_message.add_reaction = AsyncMock()
+        mock_channel, _ = self._make_channel()
+        perm_req = PermissionRequest(
+            tool_name="Bash",
+            tool_use_id="test-123",
+            tool_input={"command": "rm -rf /"},
+        )
 
-            mock_channel = MagicMock()
-            mock_channel.send = AsyncMock(return_value=mock_message)
+        request = asyncio.create_task(bot._request_permission(mock_channel, perm_req, 12345))
+        await self._react(bot, 111, 12345, PERMISSION_DENY_EMOJI)
 
-            # Mock wait_for to simulate user denying
-            bot.wait_for = AsyncMock(
-                return_value=(MagicMock(emoji=PERMISSION_DENY_EMOJI), MagicMock())
-            )
-
-            perm_req = PermissionRequest(
-                tool_name="Bash",
-                tool_use_id="test-123",
-                tool_input={"command": "rm -rf /"},
-            )
-
-            result = await bot._request_permission(mock_channel, perm_req, 12345)
+        assert await request is False
 
-            assert result is False
+    @pytest.mark.asyncio
+    async def test_permission_request_ignores_other_users(self, bot: BackchannelBot) -> None:
+        """Only the requesting user's reaction answers the prompt."""
+        mock_channel, _ = self._make_channel()
+        perm_req = PermissionRequest(
+            tool_name="Bash",
+            tool_use_id="test-123",
+            tool_input={"command": "ls"},
+        )
+
+        request = asyncio.create_task(bot._request_permission(mock_channel, perm_req, 12345))
+        await self._react(bot, 111, 99999, PERMISSION_DENY_EMOJI)
+        assert not request.done()
+        await self._react(bot, 111, 12345, PERMISSION_ALLOW_EMOJI)
+
+        assert await request is True
 
     @pytest.mark.asyncio
-    async def test_permission_request_timeout_returns_false(self) -> None:
+    async def test_permission_request_timeout_returns_false(self, bot: BackchannelBot) -> None:
         """Permission request returns False on timeout."""
-        import asyncio
-
-        with patch.dict(
-            os.environ,
-            {
-                "DISCORD_BOT_TOKEN": "test-token",
-            },
-        ):
-            config = Config()
-            claude_client = MagicMock(spec=ClaudeClient)
-            bot = BackchannelBot(config=config, claude_client=claude_client)
-
-            mock_message = AsyncMock()
-            mock_message.add_reaction = AsyncMock()
-
-            mock_channel = MagicMock()
-            mock_channel.send = AsyncMock(return_value=mock_message)
-
-            # Mock wait_for to simulate timeout
-            bot.wait_for = AsyncMock(side_effect=asyncio.TimeoutError())
-
-            perm_req = PermissionRequest(
-                tool_name="Write",
-                tool_use_id="test-456",
-                tool_input={"file_path": "/test", "content": "test"},
-            )
-
+        mock_channel, mock_message = self._make_channel()
+        perm_req = PermissionRequest(
+            tool_name="Write",
+            tool_use_id="test-456",
+            tool_input={"file_path": "/test", "content": "test"},
+        )
+
+        with patch("backchannel_bot.discord_client.PERMISSION_TIMEOUT_SECONDS", 0.01):
             result = await bot._request_permission(mock_channel, perm_req, 12345)
 
-            assert result is False
-            # Message should be edited to show timeout
-            mock_message.edit.assert_called()
+        assert result is False
+        assert bot._pending_permissions == {}
+        # Message should be edited to show timeout
+        mock_message.edit.assert_called()